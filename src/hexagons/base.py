@@ -1,9 +1,37 @@
 """Base class for hexagonal cells in the life simulation."""
 
 import math
+from functools import lru_cache
 from typing import List, Tuple, ClassVar
 from ..config import COLORS
 
+# Square root of 3, used for the vertical extent of hexagons
+SQRT3 = math.sqrt(3)
+
+
+@lru_cache(maxsize=None)
+def hex_offsets(a: float) -> Tuple[Tuple[float, float], ...]:
+    """Get the vertex offsets from the center for a hexagon of the given size.
+
+    All cells in a mesh share the same size, so the offsets are computed once
+    and reused for every hexagon.
+
+    Args:
+        a (float): Length of the hexagon's side
+
+    Returns:
+        Tuple[Tuple[float, float], ...]: (dx, dy) offsets of the six vertices
+    """
+    half_height = a * SQRT3 / 2
+    return (
+        (a, 0.0),
+        (a/2, half_height),
+        (-a/2, half_height),
+        (-a, 0.0),
+        (-a/2, -half_height),
+        (a/2, -half_height)
+    )
+
 
 class Hexagon:
     """Base class for hexagonal cells in the life simulation.
@@ -18,6 +46,8 @@ class Hexagon:
         points (List[Tuple[float, float]]): List of (x, y) coordinates for the hexagon's vertices
     """
 
+    __slots__ = ('cx', 'cy', 'a', '_points')
+
     # Default color for the hexagon
     DEFAULT_COLOR: ClassVar[Tuple[int, int, int]] = COLORS['BROWN']
 
@@ -33,12 +63,7 @@ class Hexagon:
         self.cy = cy
         self.a = a
         self._points: List[Tuple[float, float]] = [
-            (cx + a, cy),
-            (cx + a/2, cy + (a * math.sqrt(3) / 2)),
-            (cx - a/2, cy + (a * math.sqrt(3) / 2)),
-            (cx - a, cy),
-            (cx - a/2, cy - (a * math.sqrt(3) / 2)),
-            (cx + a/2, cy - (a * math.sqrt(3) / 2))
+            (cx + dx, cy + dy) for dx, dy in hex_offsets(a)
         ]
     
     def update(self, t: float) -> None:
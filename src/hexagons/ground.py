@@ -12,6 +12,8 @@ class GroundHexagon(Hexagon):
     Ground cells serve as the base terrain in the simulation and do not change over time.
     """
 
+    __slots__ = ()
+
     def update(self, t: float) -> None:
         """Update the ground cell's state (no-op as ground doesn't change).
 
@@ -15,8 +15,13 @@ class PlantHexagon(Hexagon):
 
     Attributes:
         state_manager (PlantStateManager): Manages the plant's lifecycle states
+        animation_time (float): Time spent flowering, used for the sway animation
+        flower_angle (float): Current sway angle of the flower dots in radians,
+            NaN until the plant starts flowering
     """
 
+    __slots__ = ('state_manager', 'animation_time', 'flower_angle')
+
     # Visual detail constants
     SEED_DOT_RADIUS = 0.15    # Relative to hexagon size
     GROWING_DOT_RADIUS = 0.45  # Relative to hexagon size (increased from 0.3)
@@ -24,6 +29,7 @@ class PlantHexagon(Hexagon):
     FLOWER_SWAY_SPEED = 1.2    # Oscillations per second (reduced from 2.0 for gentler motion)
     FLOWER_SWAY_ANGLE = 0.3    # Maximum rotation in radians (about 17 degrees)
     FLOWER_ORBIT_RADIUS = 0.4   # Distance from center (relative to hexagon size)
+    FLOWER_SWAY_OMEGA = math.tau * FLOWER_SWAY_SPEED  # Angular frequency of the sway (radians per second)
 
     def __init__(self, cx: float, cy: float, a: float) -> None:
         """Initialize a plant hexagonal cell.
@@ -36,6 +42,7 @@ class PlantHexagon(Hexagon):
         super().__init__(cx, cy, a)
         self.state_manager = PlantStateManager()
         self.animation_time = 0.0  # Time accumulator for animation
+        self.flower_angle = math.nan  # Not a number until the plant starts flowering
 
     def update(self, t: float) -> None:
         """Update the plant's state based on the current simulation time.
@@ -51,7 +58,20 @@ class PlantHexagon(Hexagon):
         if self.state_manager.state == PlantState.FLOWERING:
             self.animation_time += t
             # Use sine wave to create swaying motion
-            self.flower_angle = math.sin(self.animation_time * self.FLOWER_SWAY_SPEED * 2 * math.pi) * self.FLOWER_SWAY_ANGLE
+            self.flower_angle = math.sin(self.animation_time * self.FLOWER_SWAY_OMEGA) * self.FLOWER_SWAY_ANGLE
+
+    def update_many(self, dt: float, steps: int) -> None:
+        """Advance the plant by several fixed time steps.
+
+        Equivalent to calling update(dt) the given number of times.
+
+        Args:
+            dt (float): Time step in seconds
+            steps (int): Number of steps to run
+        """
+        update = self.update
+        for _ in range(steps):
+            update(dt)
 
     @property
     def base_color(self) -> Tuple[int, int, int]:
@@ -1,12 +1,16 @@
 """Plant states and state management for the life simulation."""
 
-from enum import Enum, auto
+from enum import IntEnum
+from typing import Optional
 import random
 from ..config import SEED_SURVIVAL_THRESHOLD, PLANT_FLOWERING_PROBABILITY
 
 
-class PlantState(Enum):
+class PlantState(IntEnum):
     """States that a plant can be in during its lifecycle.
+
+    Values follow lifecycle order starting at 0, so states compare as plain
+    integers and can index per-state lookup tables.
     
     States:
         SEED: Initial state, not yet grown
@@ -16,12 +20,12 @@ class PlantState(Enum):
         DYING: Plant is losing health and will eventually die
         DEAD: Plant has died and will be replaced by ground
     """
-    SEED = auto()
-    GROWING = auto()
-    MATURE = auto()
-    FLOWERING = auto()
-    DYING = auto()
-    DEAD = auto()
+    SEED = 0
+    GROWING = 1
+    MATURE = 2
+    FLOWERING = 3
+    DYING = 4
+    DEAD = 5
 
 
 class PlantStateManager:
@@ -39,15 +43,33 @@ class PlantStateManager:
         flowering_probability (float): Probability (0-1) of a plant flowering
     """
     
+    __slots__ = ('state', 'time_in_state', 'health', 'growth', 'has_checked_flowering',
+                 '_seed_survival_threshold', '_flowering_probability', '_rng')
+
     # State transition thresholds
     SEED_DURATION = 2.0     # Time to stay in seed state
     GROWTH_THRESHOLD = 3.0  # Time needed to reach mature state
     MATURE_MAX_TIME = 5.0   # Maximum time before dying starts
     FLOWERING_DURATION = MATURE_MAX_TIME  # Time to stay in flowering state
+    FLOWERING_CHECK_TIME = MATURE_MAX_TIME * 0.75  # Flowering is checked in the last quarter of maturity
     DYING_DURATION = 8.0    # How long it takes to die (increased from 3.0)
     
-    def __init__(self):
-        """Initialize the plant state manager."""
+    def __init__(self, rng: Optional[random.Random] = None):
+        """Initialize the plant state manager.
+
+        Args:
+            rng (Optional[random.Random]): Source of random numbers for the survival
+                and flowering checks. Defaults to the global random module.
+        """
+        self._rng = rng
+        self.reset()
+
+    def reset(self) -> None:
+        """Return the manager to a fresh seed so it can be reused for a new plant.
+
+        Restores the default survival and flowering probabilities. The random
+        source given at construction is kept.
+        """
         self.state = PlantState.SEED
         self.time_in_state = 0.0
         self.health = 1.0
@@ -102,13 +124,23 @@ class PlantStateManager:
             raise ValueError("Flowering probability must be between 0 and 1")
         self._flowering_probability = value
 
+    def _random(self) -> float:
+        """Draw a random number in [0, 1) from the plant's random source.
+
+        Returns:
+            float: The random number
+        """
+        if self._rng is None:
+            return random.random()
+        return self._rng.random()
+
     def _check_seed_survival(self) -> bool:
         """Check if the seed survives to growing phase.
         
         Returns:
             bool: True if the seed survives, False if it dies
         """
-        return random.random() < self.seed_survival_threshold
+        return self._random() < self.seed_survival_threshold
 
     def _check_flowering(self) -> bool:
         """Check if the plant should start flowering.
@@ -116,7 +148,7 @@ class PlantStateManager:
         Returns:
             bool: True if the plant should flower, False otherwise
         """
-        return random.random() < self.flowering_probability
+        return self._random() < self.flowering_probability
     
     def update(self, dt: float) -> None:
         """Update the plant's state based on time passed.
@@ -124,11 +156,17 @@ class PlantStateManager:
         Args:
             dt (float): Time passed since last update in seconds
         """
-        self.time_in_state += dt
+        # Read the state and timer once; the branches below only use the locals
+        state = self.state
+        if state == PlantState.DEAD:
+            return  # Dead plants have no transitions left
+
+        time_in_state = self.time_in_state + dt
+        self.time_in_state = time_in_state
         
-        if self.state == PlantState.SEED:
+        if state == PlantState.SEED:
             # Check for state transition at the end of seed phase
-            if self.time_in_state >= self.SEED_DURATION:
+            if time_in_state >= self.SEED_DURATION:
                 # Determine if seed survives
                 if self._check_seed_survival():
                     self.state = PlantState.GROWING
@@ -136,37 +174,39 @@ class PlantStateManager:
                     self.state = PlantState.DYING
                 self.time_in_state = 0.0
             
-        elif self.state == PlantState.GROWING:
+        elif state == PlantState.GROWING:
             # Update growth progress
-            self.growth = min(1.0, self.time_in_state / self.GROWTH_THRESHOLD)
-            if self.growth >= 1.0:
+            growth = min(1.0, time_in_state / self.GROWTH_THRESHOLD)
+            self.growth = growth
+            if growth >= 1.0:
                 self.state = PlantState.MATURE
                 self.time_in_state = 0.0
                 self.has_checked_flowering = False  # Reset the flag when entering mature state
                 
-        elif self.state == PlantState.MATURE:
+        elif state == PlantState.MATURE:
             # Check for flowering in the last quarter of mature state, but only once
-            if self.time_in_state >= self.MATURE_MAX_TIME * 0.75 and not self.has_checked_flowering:
+            if not self.has_checked_flowering and time_in_state >= self.FLOWERING_CHECK_TIME:
                 self.has_checked_flowering = True
                 if self._check_flowering():
                     self.state = PlantState.FLOWERING
                     self.time_in_state = 0.0
                     return  # Skip the dying check if we're flowering
             # After max time, start dying if not flowering
-            if self.time_in_state >= self.MATURE_MAX_TIME:
+            if time_in_state >= self.MATURE_MAX_TIME:
                 self.state = PlantState.DYING
                 self.time_in_state = 0.0
 
-        elif self.state == PlantState.FLOWERING:
+        elif state == PlantState.FLOWERING:
             # After flowering duration, start dying
-            if self.time_in_state >= self.FLOWERING_DURATION:
+            if time_in_state >= self.FLOWERING_DURATION:
                 self.state = PlantState.DYING
                 self.time_in_state = 0.0
                 
-        elif self.state == PlantState.DYING:
+        elif state == PlantState.DYING:
             # Gradually reduce health until death
-            self.health = max(0.0, 1.0 - (self.time_in_state / self.DYING_DURATION))
-            if self.health <= 0:
+            health = max(0.0, 1.0 - (time_in_state / self.DYING_DURATION))
+            self.health = health
+            if health <= 0:
                 self.state = PlantState.DEAD
                 self.time_in_state = 0.0
     
@@ -179,7 +219,7 @@ class PlantStateManager:
         """
         if self.state == PlantState.GROWING:
             return self.growth
-        elif self.state in [PlantState.MATURE, PlantState.FLOWERING]:
+        elif self.state in (PlantState.MATURE, PlantState.FLOWERING):
             return 1.0
         elif self.state == PlantState.DYING:
             return self.health
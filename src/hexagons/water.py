@@ -12,6 +12,8 @@ class WaterHexagon(Hexagon):
     Water cells serve as terrain features and do not change over time.
     """
 
+    __slots__ = ()
+
     def update(self, t: float) -> None:
         """Update the water cell's state (no-op as water doesn't change).
 
@@ -1,9 +1,10 @@
 """Hexagonal grid system for the life simulation."""
 
-import math
 import random
-from typing import List, Union, Tuple, Set
+from typing import List, Optional, Union, Tuple, Set
 from collections import deque
+import numpy as np
+from ..hexagons.base import SQRT3, hex_offsets
 from ..hexagons.plant import PlantHexagon
 from ..hexagons.ground import GroundHexagon
 from ..hexagons.water import WaterHexagon
@@ -14,6 +15,9 @@ from ..config import (
 )
 from ..hexagons.plant_states import PlantState
 
+# Cell kind codes returned by HexMesh.cell_kinds
+GROUND, PLANT, WATER = range(3)
+
 
 class HexMesh:
     """A hexagonal grid system that manages the life simulation world.
@@ -27,9 +31,17 @@ class HexMesh:
         num_rows (int): Number of rows in the grid
         grid_bounds (Tuple[float, float, float, float]): Grid boundaries (left, right, top, bottom)
         cell_size (float): Size of hexagon cells (side length)
+        cell_x (np.ndarray): X-coordinate of each cell's center, indexed like hexagons
+        cell_y (np.ndarray): Y-coordinate of each cell's center, indexed like hexagons
+        cell_points (np.ndarray): Vertices of every cell as one (N, 6, 2) array,
+            indexed like hexagons
     """
 
-    def __init__(self, num_columns: int, num_rows: int, display_width: int, display_height: int) -> None:
+    # Number of random values pre-drawn per refill of the water generation buffer
+    RANDOM_BUFFER_SIZE = 4096
+
+    def __init__(self, num_columns: int, num_rows: int, display_width: int, display_height: int,
+                 rng: Optional[random.Random] = None, plant_probability: Optional[float] = None) -> None:
         """Initialize the hexagonal grid.
         
         Args:
@@ -37,6 +49,10 @@ class HexMesh:
             num_rows (int): Number of rows in the grid
             display_width (int): Width of the display area in pixels
             display_height (int): Height of the display area in pixels
+            rng (Optional[random.Random]): Source of random numbers for generating the
+                grid. Defaults to the global random module.
+            plant_probability (Optional[float]): Probability (0-1) of a ground cell
+                starting as a plant. Defaults to PLANT_SPAWN_PROBABILITY.
         """
         self.num_columns = num_columns
         self.num_rows = num_rows
@@ -49,7 +65,7 @@ class HexMesh:
         
         # Calculate total grid dimensions
         grid_width = num_columns * self.cell_size * 1.75  # Total width with spacing
-        grid_height = num_rows * self.cell_size * math.sqrt(3)  # Total height
+        grid_height = num_rows * self.cell_size * SQRT3  # Total height
         
         # Center the grid in the display
         self.offset_x = (display_width - grid_width) / 2
@@ -63,6 +79,21 @@ class HexMesh:
             display_height  # bottom bound at display height
         )
         
+        # Random numbers for water and plant generation are drawn in batches from
+        # a numpy generator seeded from the random source, so seeding that source
+        # keeps mesh generation reproducible.
+        self._random_source = rng
+        self._plant_probability = plant_probability
+        self._rng = np.random.default_rng((random if rng is None else rng).getrandbits(64))
+        self._random_buffer = self._rng.random(self.RANDOM_BUFFER_SIZE)
+        self._random_index = 0
+        
+        # Number of water hexagons, maintained while generating water groups
+        self._water_count = 0
+        
+        # Neighbor lists depend only on the grid shape, so they are computed once
+        self._adjacency = [self._compute_adjacent_indices(i) for i in range(num_columns * num_rows)]
+        
         self.hexagons = []
         self._initialize_grid()
 
@@ -71,12 +102,68 @@ class HexMesh:
         self._create_ground_hexagons()
         
         # Generate water groups
-        if random.random() < WATER_SPAWN_PROBABILITY:
+        if self._random() < WATER_SPAWN_PROBABILITY:
             self._generate_water_groups()
         
         # Finally add plants on remaining ground hexagons
         self._add_plants()
 
+    def _random(self) -> float:
+        """Draw a random number in [0, 1) from the mesh's random source.
+
+        Returns:
+            float: The random number
+        """
+        if self._random_source is None:
+            return random.random()
+        return self._random_source.random()
+
+    def _next_random(self) -> float:
+        """Get the next random number from the pre-drawn buffer.
+        
+        The buffer is refilled from the numpy generator once exhausted.
+        
+        Returns:
+            float: Random number in the range [0, 1)
+        """
+        if self._random_index >= len(self._random_buffer):
+            self._random_buffer = self._rng.random(self.RANDOM_BUFFER_SIZE)
+            self._random_index = 0
+        value = self._random_buffer[self._random_index]
+        self._random_index += 1
+        return value
+
+    def _random_int(self, low: int, high: int) -> int:
+        """Get a random integer N such that low <= N <= high.
+        
+        Args:
+            low (int): Lower bound (inclusive)
+            high (int): Upper bound (inclusive)
+            
+        Returns:
+            int: Random integer in the given range
+        """
+        return low + int(self._next_random() * (high - low + 1))
+
+    def _random_sample(self, population: List[int], k: int) -> List[int]:
+        """Choose k unique random elements from a population.
+        
+        Uses a partial Fisher-Yates shuffle on a copy of the population.
+        
+        Args:
+            population (List[int]): Elements to choose from
+            k (int): Number of elements to choose
+            
+        Returns:
+            List[int]: The chosen elements
+        """
+        pool = list(population)
+        n = len(pool)
+        for i in range(k):
+            j = i + int(self._next_random() * (n - i))
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
     def _create_ground_hexagons(self) -> None:
         """Create initial grid of all ground hexagons using spaced pattern.
         
@@ -86,19 +173,45 @@ class HexMesh:
         - Alternate rows are shifted down by half the hexagon height
         """
         hex_width = 2 * self.cell_size  # Full width of a hexagon
-        hex_height = self.cell_size * math.sqrt(3)  # Height of a hexagon
+        hex_height = self.cell_size * SQRT3  # Height of a hexagon
         
-        for col in range(self.num_columns):
-            for row in range(self.num_rows):
-                # Calculate base position with spacing
-                cx = self.offset_x + hex_width/2 + (col * hex_width * 0.75)  # Reduced spacing between columns
-                cy = self.offset_y + hex_height/2 + (row * hex_height)
-                
-                # Shift alternate columns down by half height
-                if col % 2 == 1:
-                    cy += hex_height / 2
-                
-                self.hexagons.append(GroundHexagon(cx, cy, self.cell_size))
+        # Precompute column and row coordinates once instead of per cell
+        column_xs = [self.offset_x + hex_width/2 + (col * hex_width * 0.75)  # Reduced spacing between columns
+                     for col in range(self.num_columns)]
+        row_ys = [self.offset_y + hex_height/2 + (row * hex_height)
+                  for row in range(self.num_rows)]
+        
+        for col, cx in enumerate(column_xs):
+            # Shift alternate columns down by half height
+            shift = hex_height / 2 if col % 2 == 1 else 0.0
+            for cy in row_ys:
+                self.hexagons.append(GroundHexagon(cx, cy + shift, self.cell_size))
+        
+        # Cell centers as contiguous arrays in the same column-major order.
+        # Cells keep their position when their type changes, so these stay valid.
+        shifts = np.where(np.arange(self.num_columns) % 2 == 1, hex_height / 2, 0.0)
+        self.cell_x = np.repeat(column_xs, self.num_rows)
+        self.cell_y = (np.asarray(row_ys)[np.newaxis, :] + shifts[:, np.newaxis]).ravel()
+        # All cells share one size, so their vertices are the centers plus one set of offsets
+        centers = np.stack((self.cell_x, self.cell_y), axis=-1)
+        self.cell_points = centers[:, np.newaxis, :] + np.asarray(hex_offsets(self.cell_size))
+
+    def cell_kinds(self) -> np.ndarray:
+        """Get the kind of every cell as an array indexed like hexagons.
+
+        The kinds are read from the current hexagons on each call, so they
+        reflect any cells assigned to the list directly.
+
+        Returns:
+            np.ndarray: Kind code (GROUND, PLANT or WATER) of each cell
+        """
+        return np.fromiter(
+            (WATER if isinstance(hexagon, WaterHexagon)
+             else PLANT if isinstance(hexagon, PlantHexagon)
+             else GROUND
+             for hexagon in self.hexagons),
+            dtype=np.int8, count=len(self.hexagons)
+        )
 
     def _get_hex_index(self, col: int, row: int) -> int:
         """Get the index of a hexagon in the grid array from its logical column and row.
@@ -118,7 +231,20 @@ class HexMesh:
         return -1
 
     def _get_adjacent_indices(self, index: int) -> List[int]:
-        """Get indices of adjacent hexagons using the columnar pattern.
+        """Get indices of adjacent hexagons from the precomputed neighbor lists.
+        
+        The returned list is shared and must not be modified.
+        
+        Args:
+            index (int): Index of the hexagon
+            
+        Returns:
+            List[int]: List of valid adjacent hexagon indices
+        """
+        return self._adjacency[index]
+
+    def _compute_adjacent_indices(self, index: int) -> List[int]:
+        """Compute indices of adjacent hexagons using the columnar pattern.
         
         In this layout, each hexagon has 6 neighbors:
         - For even columns: neighbors are at same level and one level up
@@ -180,9 +306,8 @@ class HexMesh:
             Tuple[Set[int], Set[int]]: (Water group indices, Indices to remove from available)
         """
         # Calculate remaining capacity for water
-        water_count = sum(1 for hex in self.hexagons if isinstance(hex, WaterHexagon))
         max_water = int(len(self.hexagons) * MAX_WATER_PERCENTAGE)
-        remaining_capacity = max_water - water_count
+        remaining_capacity = max_water - self._water_count
         
         # If we can't add minimum size (4), return empty
         if remaining_capacity < 4:
@@ -191,7 +316,7 @@ class HexMesh:
         # Initialize sets for tracking
         water_group = {start_index}
         indices_to_remove = {start_index}
-        target_size = min(random.randint(4, 8), remaining_capacity)
+        target_size = min(self._random_int(4, 8), remaining_capacity)
         attempts = 0
         max_attempts = 20
 
@@ -203,7 +328,8 @@ class HexMesh:
         # Try to grow the group
         while len(water_group) < target_size and attempts < max_attempts:
             attempts += 1
-            current = random.choice(list(water_group))
+            group_indices = list(water_group)
+            current = group_indices[int(self._next_random() * len(group_indices))]
             adjacent = self._get_adjacent_indices(current)
             
             # Filter for valid adjacent positions
@@ -217,10 +343,10 @@ class HexMesh:
 
             if valid_adjacent:
                 # Add some random adjacent positions
-                new_water = set(random.sample(valid_adjacent, 
-                                          min(len(valid_adjacent), 
-                                              min(random.randint(1, 3),
-                                                  target_size - len(water_group)))))  # Ensure we don't exceed target
+                new_water = set(self._random_sample(valid_adjacent, 
+                                                    min(len(valid_adjacent), 
+                                                        min(self._random_int(1, 3),
+                                                            target_size - len(water_group)))))  # Ensure we don't exceed target
                 water_group.update(new_water)
                 indices_to_remove.update(new_water)
 
@@ -235,69 +361,82 @@ class HexMesh:
         # Calculate maximum water coverage
         total_hexagons = len(self.hexagons)
         max_water_hexagons = int(total_hexagons * MAX_WATER_PERCENTAGE)
-        water_count = sum(1 for hex in self.hexagons if isinstance(hex, WaterHexagon))
+        # Count existing water once; it is then kept up to date as groups are added
+        is_water = self.cell_kinds() == WATER
+        self._water_count = int(np.count_nonzero(is_water))
         
         # If we're already at or above the maximum, don't add more water
-        if water_count >= max_water_hexagons:
+        if self._water_count >= max_water_hexagons:
             return
             
         attempts = 0
         max_attempts = total_hexagons // 2
         
         # Create set of available indices (excluding existing water)
-        available_indices = {i for i, hex in enumerate(self.hexagons) 
-                           if not isinstance(hex, WaterHexagon)}
+        available_indices = set(np.flatnonzero(~is_water).tolist())
 
-        while attempts < max_attempts and water_count < max_water_hexagons:
+        while attempts < max_attempts and self._water_count < max_water_hexagons:
             attempts += 1
             
             if not available_indices:
                 break
                 
             # Choose a random starting position
-            start_index = random.choice(list(available_indices))
+            candidates = list(available_indices)
+            start_index = candidates[int(self._next_random() * len(candidates))]
             
             # Check if adding a new group would exceed max water percentage
-            if water_count + 4 > max_water_hexagons:  # Minimum group size is 4
+            if self._water_count + 4 > max_water_hexagons:  # Minimum group size is 4
                 break
             
             # Try to grow a water group from this position
             water_group, indices_to_remove = self._grow_water_group(start_index, available_indices)
             
             # If group was successfully created and won't exceed limit, convert hexagons to water
-            if water_group and (water_count + len(water_group)) <= max_water_hexagons:
+            if water_group and (self._water_count + len(water_group)) <= max_water_hexagons:
                 for idx in water_group:
                     self.hexagons[idx] = WaterHexagon(
                         self.hexagons[idx].cx,
                         self.hexagons[idx].cy,
                         self.hexagons[idx].a
                     )
-                water_count += len(water_group)
+                self._water_count += len(water_group)
             
             # Remove processed indices from available positions
             available_indices -= indices_to_remove
 
     def _add_plants(self) -> None:
         """Add plants to remaining ground hexagons."""
-        for i, hexagon in enumerate(self.hexagons):
-            if isinstance(hexagon, GroundHexagon) and random.random() < PLANT_SPAWN_PROBABILITY:
-                self.hexagons[i] = PlantHexagon(hexagon.cx, hexagon.cy, hexagon.a)
+        probability = self._plant_probability
+        if probability is None:
+            probability = PLANT_SPAWN_PROBABILITY
+        ground = np.flatnonzero(self.cell_kinds() == GROUND)
+        # Draw the spawn rolls for all ground cells at once; a certain spawn needs none
+        if probability < 1.0:
+            ground = ground[self._rng.random(len(ground)) < probability]
+        
+        hexagons = self.hexagons
+        for i in ground.tolist():
+            hexagon = hexagons[i]
+            hexagons[i] = PlantHexagon(hexagon.cx, hexagon.cy, hexagon.a)
 
-    def _is_position_valid(self, cx: float, cy: float) -> bool:
+    def _is_position_valid(self, cx: Union[float, np.ndarray], cy: Union[float, np.ndarray]) -> Union[bool, np.ndarray]:
         """Check if a position is within the grid bounds.
         
+        Also accepts arrays of coordinates to check many positions at once.
+        
         Args:
-            cx (float): X-coordinate of the position
-            cy (float): Y-coordinate of the position
+            cx (Union[float, np.ndarray]): X-coordinate of the position
+            cy (Union[float, np.ndarray]): Y-coordinate of the position
             
         Returns:
-            bool: True if the position is within bounds, False otherwise
+            Union[bool, np.ndarray]: True if the position is within bounds, False otherwise
         """
         left, right, top, bottom = self.grid_bounds
         # Add a small margin (half a cell) to account for hexagon extent
         margin = self.cell_size / 2
-        return (left - margin <= cx <= right + margin and 
-                top - margin <= cy <= bottom + margin)
+        return ((left - margin <= cx) & (cx <= right + margin) &
+                (top - margin <= cy) & (cy <= bottom + margin))
 
     def _convert_plants_to_ground(self, dead_plants: List[Tuple[int, PlantHexagon]]) -> None:
         """Convert multiple dead plants to ground hexagons in bulk.
@@ -308,16 +447,26 @@ class HexMesh:
         Raises:
             ValueError: If any plant's position is outside the grid bounds
         """
-        # First validate all positions
-        for index, plant in dead_plants:
-            if not self._is_position_valid(plant.cx, plant.cy):
-                raise ValueError(
-                    f"Plant position ({plant.cx}, {plant.cy}) is outside grid bounds {self.grid_bounds}"
-                )
+        if not dead_plants:
+            return
+        plants = [plant for _, plant in dead_plants]
+        
+        # First validate all positions in one pass
+        count = len(plants)
+        valid = self._is_position_valid(
+            np.fromiter((plant.cx for plant in plants), dtype=float, count=count),
+            np.fromiter((plant.cy for plant in plants), dtype=float, count=count)
+        )
+        if not valid.all():
+            plant = plants[int(np.argmin(valid))]  # First invalid plant
+            raise ValueError(
+                f"Plant position ({plant.cx}, {plant.cy}) is outside grid bounds {self.grid_bounds}"
+            )
         
         # Then perform all conversions
+        hexagons = self.hexagons
         for index, plant in dead_plants:
-            self.hexagons[index] = GroundHexagon(plant.cx, plant.cy, plant.a)
+            hexagons[index] = GroundHexagon(plant.cx, plant.cy, plant.a)
 
     def update(self, t: float) -> None:
         """Update all cells in the grid.
@@ -2,6 +2,7 @@
 
 import pygame
 import math
+from collections import OrderedDict
 from typing import Tuple
 from .base import BaseRenderer, Renderable
 from ..config import COLORS
@@ -11,11 +12,18 @@ from ..hexagons.plant_states import PlantState
 class PygameRenderer(BaseRenderer):
     """Pygame implementation of the renderer interface."""
     
+    # Maximum number of rendered text surfaces kept in the cache
+    TEXT_CACHE_SIZE = 256
+    
     def __init__(self):
         """Initialize the Pygame renderer."""
         self.screen = None
         self.font = None
         self.small_font = None
+        self._size = (0, 0)
+        self._overlay = None
+        # Rendered text surfaces keyed by (text, color, font_size), least recently used first
+        self._text_cache = OrderedDict()
     
     def setup(self, width: int, height: int) -> None:
         """Set up the Pygame renderer.
@@ -27,8 +35,13 @@ class PygameRenderer(BaseRenderer):
         pygame.init()
         pygame.font.init()
         self.screen = pygame.display.set_mode((width, height))
+        # Screen size is constant after setup, so the overlay surface is reused
+        self._size = (width, height)
+        self._overlay = pygame.Surface(self._size, pygame.SRCALPHA)
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        # Surfaces rendered with previous fonts are no longer valid
+        self._text_cache.clear()
     
     def begin_frame(self) -> None:
         """Clear the screen and prepare for rendering."""
@@ -57,11 +70,13 @@ class PygameRenderer(BaseRenderer):
             if hasattr(hexagon, 'state_manager') and hexagon.state_manager.state == PlantState.FLOWERING:
                 # Use the plant's flower angle and orbit radius for dynamic positioning
                 base_angle = getattr(hexagon, 'flower_angle', 0)
+                if math.isnan(base_angle):
+                    base_angle = 0.0  # No sway angle yet before the first flowering update
                 distance = hexagon.a * hexagon.FLOWER_ORBIT_RADIUS
                 
                 # Calculate three points at 120 degrees apart
                 for i in range(3):
-                    theta = base_angle + (i * 2 * math.pi / 3)  # 120 degrees apart
+                    theta = base_angle + (i * math.tau / 3)  # 120 degrees apart
                     x = int(hexagon.cx + distance * math.cos(theta))
                     y = int(hexagon.cy + distance * math.sin(theta))
                     pygame.draw.circle(self.screen, hexagon.detail_color, (x, y), radius)
@@ -84,23 +99,49 @@ class PygameRenderer(BaseRenderer):
             centered (bool, optional): Whether to center the text. Defaults to False.
             font_size (int, optional): Size of the font. Defaults to 36.
         """
-        font = self.font if font_size >= 36 else self.small_font
-        text_surface = font.render(text, True, color)
+        text_surface = self._render_text(text, tuple(color), font_size)
         if centered:
             text_rect = text_surface.get_rect(center=position)
         else:
             text_rect = text_surface.get_rect(topleft=position)
         self.screen.blit(text_surface, text_rect)
     
+    def _render_text(self, text: str, color: Tuple[int, int, int],
+                     font_size: int) -> pygame.Surface:
+        """Render text to a surface, reusing the surface for repeated text.
+        
+        Static strings are only rasterized once. The least recently used
+        surface is dropped once the cache holds TEXT_CACHE_SIZE entries.
+        
+        Args:
+            text (str): The text to render
+            color (Tuple[int, int, int]): RGB color of the text
+            font_size (int): Size of the font
+            
+        Returns:
+            pygame.Surface: Surface containing the rendered text
+        """
+        key = (text, color, font_size)
+        cache = self._text_cache
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            return surface
+        
+        font = self.font if font_size >= 36 else self.small_font
+        surface = cache[key] = font.render(text, True, color)
+        if len(cache) > self.TEXT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return surface
+    
     def draw_overlay(self, color: Tuple[int, int, int, int]) -> None:
         """Draw a semi-transparent overlay using Pygame.
         
         Args:
             color (Tuple[int, int, int, int]): RGBA color of the overlay
         """
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        pygame.draw.rect(overlay, color, overlay.get_rect())
-        self.screen.blit(overlay, (0, 0))
+        self._overlay.fill(color)
+        self.screen.blit(self._overlay, (0, 0))
     
     def cleanup(self) -> None:
         """Clean up Pygame resources."""
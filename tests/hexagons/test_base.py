@@ -2,7 +2,7 @@
 
 import unittest
 import math
-from src.hexagons.base import Hexagon
+from src.hexagons.base import Hexagon, hex_offsets
 from tests.test_config import MOCK_CELL_SIZE, MOCK_COLORS
 
 
@@ -44,6 +44,15 @@ class TestHexagon(unittest.TestCase):
         bottom_dist = abs(self.hexagon.points[1][1] - self.hexagon.cy) # Distance from center to bottom point
         self.assertAlmostEqual(top_dist, bottom_dist)
 
+    def test_hex_offsets_shared(self):
+        """Test that hexagons of the same size share one set of vertex offsets."""
+        self.assertIs(hex_offsets(MOCK_CELL_SIZE), hex_offsets(MOCK_CELL_SIZE))
+
+        other = Hexagon(120, 80, MOCK_CELL_SIZE)
+        for (x1, y1), (x2, y2) in zip(self.hexagon.points, other.points):
+            self.assertAlmostEqual(x1 - self.hexagon.cx, x2 - other.cx)
+            self.assertAlmostEqual(y1 - self.hexagon.cy, y2 - other.cy)
+
     def test_color_property(self):
         """Test that the default color is returned correctly."""
         self.assertEqual(self.hexagon.color, MOCK_COLORS['BROWN'])
@@ -56,12 +65,8 @@ class TestHexagon(unittest.TestCase):
 
     def test_update_method(self):
         """Test that update method exists and can be called."""
-        try:
-            self.hexagon.update(1.0)
-            success = True
-        except Exception:
-            success = False
-        self.assertTrue(success)
+        # Any exception errors the test with its full traceback
+        self.hexagon.update(1.0)
 
 
 if __name__ == '__main__':
@@ -18,9 +18,9 @@ class TestGroundHexagon(unittest.TestCase):
 
     def test_update_no_change(self):
         """Test that update method doesn't change the state."""
-        initial_points = self.ground.points.copy()
+        initial_points = tuple(map(tuple, self.ground.points))
         self.ground.update(1.5)
-        self.assertEqual(self.ground.points, initial_points)
+        self.assertEqual(tuple(map(tuple, self.ground.points)), initial_points)
 
     def test_color(self):
         """Test that the ground hexagon returns the correct color."""
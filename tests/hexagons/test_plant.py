@@ -1,14 +1,44 @@
 """Unit tests for the PlantHexagon class."""
 
 import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 from src.hexagons.plant import PlantHexagon
-from src.hexagons.plant_states import PlantState
+from src.hexagons.plant_states import PlantState, PlantStateManager
 from tests.test_config import MOCK_CELL_SIZE, MOCK_COLORS
 import math
+import random
+
+# Plant states bound once at import
+_SEED, _GROWING, _MATURE, _FLOWERING, _DYING, _DEAD = (
+    PlantState.SEED, PlantState.GROWING, PlantState.MATURE,
+    PlantState.FLOWERING, PlantState.DYING, PlantState.DEAD
+)
+
+# Expected visuals per state: (state, base color, detail color, detail radius)
+_STATE_VISUAL_MAP = (
+    (_SEED, MOCK_COLORS['BROWN'], MOCK_COLORS['YELLOW'], PlantHexagon.SEED_DOT_RADIUS),
+    (_GROWING, MOCK_COLORS['BROWN'], MOCK_COLORS['GROWING'], PlantHexagon.GROWING_DOT_RADIUS),
+    # Flowering keeps the mature background with red flower dots
+    (_FLOWERING, MOCK_COLORS['MATURE'], MOCK_COLORS['FLOWER'], PlantHexagon.FLOWER_DOT_RADIUS),
+    # Remaining states have a black (invisible) detail with no radius
+    (_MATURE, MOCK_COLORS['MATURE'], (0, 0, 0), 0.0),
+    (_DYING, MOCK_COLORS['DYING'], (0, 0, 0), 0.0),
+    (_DEAD, MOCK_COLORS['DEAD'], (0, 0, 0), 0.0),
+)
+
+
+def _state_manager_stub(state):
+    """Create a lightweight state manager stub fixed at the given state."""
+    return SimpleNamespace(state=state, update=lambda dt: None)
 
 
 class TestPlantHexagon(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Create the state manager stub shared by the mapping tests."""
+        cls.state_manager_stub = _state_manager_stub(_SEED)
+
     def setUp(self):
         """Set up test fixtures before each test method."""
         self.plant = PlantHexagon(50, 50, MOCK_CELL_SIZE)
@@ -21,6 +51,12 @@ class TestPlantHexagon(unittest.TestCase):
         # Only verify that a state manager exists, not its internal state
         self.assertIsNotNone(self.plant.state_manager)
 
+    def test_slots(self):
+        """Test that plant attributes are stored in slots rather than a __dict__."""
+        self.assertFalse(hasattr(self.plant, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.plant.unknown_attribute = 1
+
     def test_update_delegates_to_state_manager(self):
         """Test that update properly delegates to the state manager."""
         # Create a mock state manager
@@ -33,77 +69,26 @@ class TestPlantHexagon(unittest.TestCase):
         # Verify the state manager's update was called with correct time
         mock_state_manager.update.assert_called_once_with(0.1)
 
-    def test_base_color_mapping(self):
-        """Test that base colors are correctly mapped to states."""
-        # Create a mock state manager
-        mock_state_manager = Mock()
-        self.plant.state_manager = mock_state_manager
-
-        # Test each state
-        state_color_map = {
-            PlantState.SEED: MOCK_COLORS['BROWN'],
-            PlantState.GROWING: MOCK_COLORS['BROWN'],
-            PlantState.MATURE: MOCK_COLORS['MATURE'],
-            PlantState.FLOWERING: MOCK_COLORS['MATURE'],  # Should keep mature color as background
-            PlantState.DYING: MOCK_COLORS['DYING'],
-            PlantState.DEAD: MOCK_COLORS['DEAD']
-        }
-
-        for state, expected_color in state_color_map.items():
-            mock_state_manager.state = state
-            self.assertEqual(self.plant.base_color, expected_color)
-
-    def test_detail_color_mapping(self):
-        """Test that detail colors are correctly mapped to states."""
-        # Create a mock state manager
-        mock_state_manager = Mock()
-        self.plant.state_manager = mock_state_manager
-
-        # Test each state
-        state_color_map = {
-            PlantState.SEED: MOCK_COLORS['YELLOW'],
-            PlantState.GROWING: MOCK_COLORS['GROWING'],
-            PlantState.FLOWERING: MOCK_COLORS['FLOWER'],  # Red color for flower dots
-            PlantState.MATURE: (0, 0, 0),  # Black (invisible)
-            PlantState.DYING: (0, 0, 0),   # Black (invisible)
-            PlantState.DEAD: (0, 0, 0)     # Black (invisible)
-        }
-
-        for state, expected_color in state_color_map.items():
-            mock_state_manager.state = state
-            self.assertEqual(self.plant.detail_color, expected_color)
-
-    def test_detail_radius_mapping(self):
-        """Test that detail radius is correctly mapped to states."""
-        # Create a mock state manager
-        mock_state_manager = Mock()
-        self.plant.state_manager = mock_state_manager
+    def test_state_visual_mapping(self):
+        """Test that base color, detail color and detail radius are mapped to states."""
+        self.plant.state_manager = self.state_manager_stub
 
-        # Test each state
-        state_radius_map = {
-            PlantState.SEED: self.plant.SEED_DOT_RADIUS,
-            PlantState.GROWING: self.plant.GROWING_DOT_RADIUS,
-            PlantState.FLOWERING: self.plant.FLOWER_DOT_RADIUS,
-            PlantState.MATURE: 0.0,
-            PlantState.DYING: 0.0,
-            PlantState.DEAD: 0.0
-        }
-
-        for state, expected_radius in state_radius_map.items():
-            mock_state_manager.state = state
-            self.assertEqual(self.plant.detail_radius, expected_radius)
+        for state, base_color, detail_color, detail_radius in _STATE_VISUAL_MAP:
+            with self.subTest(state=state):
+                self.state_manager_stub.state = state
+                self.assertEqual(self.plant.base_color, base_color)
+                self.assertEqual(self.plant.detail_color, detail_color)
+                self.assertEqual(self.plant.detail_radius, detail_radius)
 
     def test_flower_animation_initialization(self):
         """Test that flower animation is properly initialized."""
         self.assertEqual(self.plant.animation_time, 0.0)
-        self.assertFalse(hasattr(self.plant, 'flower_angle'))  # Should not exist until flowering
+        self.assertTrue(math.isnan(self.plant.flower_angle))  # No angle until flowering
 
     def test_flower_animation_update(self):
         """Test that flower animation updates correctly during flowering state."""
         # Set plant to flowering state
-        mock_state_manager = Mock()
-        mock_state_manager.state = PlantState.FLOWERING
-        self.plant.state_manager = mock_state_manager
+        self.plant.state_manager = _state_manager_stub(_FLOWERING)
 
         # Test animation after one update
         dt = 0.1
@@ -111,41 +96,65 @@ class TestPlantHexagon(unittest.TestCase):
         self.assertEqual(self.plant.animation_time, dt)
         
         # Check that flower_angle is calculated correctly
-        expected_angle = math.sin(dt * self.plant.FLOWER_SWAY_SPEED * 2 * math.pi) * self.plant.FLOWER_SWAY_ANGLE
-        self.assertAlmostEqual(self.plant.flower_angle, expected_angle)
+        expected_angle = math.sin(dt * self.plant.FLOWER_SWAY_OMEGA) * self.plant.FLOWER_SWAY_ANGLE
+        self.assertTrue(math.isclose(self.plant.flower_angle, expected_angle, abs_tol=1e-9))
 
         # Test animation accumulates time correctly
         self.plant.update(dt)
         self.assertEqual(self.plant.animation_time, dt * 2)
 
+    def test_flower_sway_omega(self):
+        """Test that the sway angular frequency matches the sway speed."""
+        self.assertAlmostEqual(self.plant.FLOWER_SWAY_OMEGA,
+                               self.plant.FLOWER_SWAY_SPEED * math.tau)
+
     def test_flower_animation_bounds(self):
         """Test that flower animation stays within expected bounds."""
-        mock_state_manager = Mock()
-        mock_state_manager.state = PlantState.FLOWERING
-        self.plant.state_manager = mock_state_manager
+        self.plant.state_manager = _state_manager_stub(_FLOWERING)
+
+        plant = self.plant
+        max_angle = plant.FLOWER_SWAY_ANGLE
 
         # Test multiple updates to verify bounds
         for _ in range(50):  # Test over multiple frames
-            self.plant.update(0.1)
+            plant.update(0.1)
             # Angle should never exceed maximum sway angle
-            self.assertLessEqual(abs(self.plant.flower_angle), self.plant.FLOWER_SWAY_ANGLE)
+            self.assertLessEqual(abs(plant.flower_angle), max_angle)
+
+    def test_update_many_matches_repeated_updates(self):
+        """Test that update_many is equivalent to repeated update calls."""
+        # Both plants use the same kind of state manager, started flowering
+        # so the run covers the sway animation and the move to dying
+        reference = PlantHexagon(50, 50, MOCK_CELL_SIZE)
+        for plant in (self.plant, reference):
+            plant.state_manager = PlantStateManager(rng=random.Random(12345))
+            plant.state_manager.state = _FLOWERING
+
+        self.plant.update_many(0.1, 60)
+        for _ in range(60):
+            reference.update(0.1)
+
+        self.assertEqual(self.plant.state_manager.state, reference.state_manager.state)
+        self.assertEqual(self.plant.state_manager.time_in_state, reference.state_manager.time_in_state)
+        self.assertEqual(self.plant.state_manager.health, reference.state_manager.health)
+        self.assertEqual(self.plant.animation_time, reference.animation_time)
+        self.assertEqual(self.plant.flower_angle, reference.flower_angle)
 
     def test_animation_state_specific(self):
         """Test that animation only updates during flowering state."""
         # Test in non-flowering state
-        mock_state_manager = Mock()
-        mock_state_manager.state = PlantState.MATURE
-        self.plant.state_manager = mock_state_manager
+        state_manager = _state_manager_stub(_MATURE)
+        self.plant.state_manager = state_manager
 
         self.plant.update(0.1)
         self.assertEqual(self.plant.animation_time, 0.0)  # Should not accumulate time
-        self.assertFalse(hasattr(self.plant, 'flower_angle'))  # Should not have angle
+        self.assertTrue(math.isnan(self.plant.flower_angle))  # Should not have angle
 
         # Switch to flowering
-        mock_state_manager.state = PlantState.FLOWERING
+        state_manager.state = _FLOWERING
         self.plant.update(0.1)
         self.assertGreater(self.plant.animation_time, 0.0)  # Should now accumulate time
-        self.assertTrue(hasattr(self.plant, 'flower_angle'))  # Should now have angle
+        self.assertFalse(math.isnan(self.plant.flower_angle))  # Should now have angle
 
 
 if __name__ == '__main__':
@@ -1,15 +1,74 @@
 """Unit tests for the plant state management system."""
 
+import copy
+import math
+import random
 import unittest
-from unittest.mock import patch
+from contextlib import contextmanager
 from src.hexagons.plant_states import PlantState, PlantStateManager
 from src.config import SEED_SURVIVAL_THRESHOLD, PLANT_FLOWERING_PROBABILITY
 
 
+class _FixedRandom:
+    """Random source that always returns the same value."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def random(self):
+        return self.value
+
+
+@contextmanager
+def fixed_random(value):
+    """Make the global random.random() return a fixed value.
+
+    A plain attribute swap is much cheaper per call than a mock.
+    """
+    original = random.random
+    random.random = _FixedRandom(value).random
+    try:
+        yield
+    finally:
+        random.random = original
+
+
 class TestPlantStateManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Precompute update steps that just pass a state's time limit."""
+        cls.past_seed_duration = PlantStateManager.SEED_DURATION + 0.1
+        cls.past_mature_max_time = PlantStateManager.MATURE_MAX_TIME + 0.1
+        cls.past_flowering_check = PlantStateManager.FLOWERING_CHECK_TIME + 0.05
+
+        # Replay the seed and growth phases once and snapshot each milestone
+        manager = PlantStateManager(rng=_FixedRandom(0.5))  # Survives with default threshold
+        manager.update(cls.past_seed_duration)
+        cls.growing_snapshot = copy.deepcopy(manager)
+        manager.update(PlantStateManager.GROWTH_THRESHOLD)
+        cls.mature_snapshot = copy.deepcopy(manager)
+
+        # One manager is shared by all tests and reset before each of them.
+        # Tests control its random draws by setting self.rng.value.
+        cls.rng = _FixedRandom(0.5)
+        cls.shared_manager = PlantStateManager(rng=cls.rng)
+
     def setUp(self):
         """Set up test fixtures before each test method."""
-        self.manager = PlantStateManager()
+        self.rng.value = 0.5  # Survives and does not flower with the defaults
+        self.manager = self.shared_manager
+        self.manager.reset()
+
+    def _from_snapshot(self, snapshot):
+        """Copy a lifecycle snapshot and give it the shared random source."""
+        manager = copy.deepcopy(snapshot)
+        manager._rng = self.rng
+        return manager
+
+    def assertClose(self, first, second, abs_tol=5e-3):
+        """Assert that two values differ by at most abs_tol."""
+        self.assertTrue(math.isclose(first, second, abs_tol=abs_tol),
+                        f"{first} != {second} within {abs_tol}")
 
     def test_initialization(self):
         """Test that state manager initializes with correct values."""
@@ -20,79 +79,93 @@ class TestPlantStateManager(unittest.TestCase):
         self.assertEqual(self.manager.seed_survival_threshold, SEED_SURVIVAL_THRESHOLD)
         self.assertEqual(self.manager.flowering_probability, PLANT_FLOWERING_PROBABILITY)
 
+    def test_slots(self):
+        """Test that manager attributes are stored in slots rather than a __dict__."""
+        self.assertFalse(hasattr(self.manager, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.manager.unknown_attribute = 1
+
+    def test_state_values(self):
+        """Test that states are integers in lifecycle order."""
+        self.assertEqual(list(PlantState), sorted(PlantState))
+        self.assertEqual([int(state) for state in PlantState], list(range(len(PlantState))))
+        self.assertEqual(PlantState.SEED, 0)
+
     def test_seed_survival_check(self):
         """Test that seed survival check works correctly."""
+        rng = _FixedRandom(0.5)
+        manager = PlantStateManager(rng=rng)
+
         # Test with random value below threshold (survives)
-        with patch('random.random', return_value=0.5):
-            self.manager.seed_survival_threshold = 0.7
-            self.assertTrue(self.manager._check_seed_survival())
+        manager.seed_survival_threshold = 0.7
+        self.assertTrue(manager._check_seed_survival())
 
         # Test with random value above threshold (dies)
-        with patch('random.random', return_value=0.8):
-            self.manager.seed_survival_threshold = 0.7
-            self.assertFalse(self.manager._check_seed_survival())
+        rng.value = 0.8
+        self.assertFalse(manager._check_seed_survival())
 
         # Test edge cases
-        with patch('random.random', return_value=0.0):
-            self.manager.seed_survival_threshold = 0.1
-            self.assertTrue(self.manager._check_seed_survival())  # Just survives
+        rng.value = 0.0
+        manager.seed_survival_threshold = 0.1
+        self.assertTrue(manager._check_seed_survival())  # Just survives
 
-        with patch('random.random', return_value=1.0):
-            self.manager.seed_survival_threshold = 0.9
-            self.assertFalse(self.manager._check_seed_survival())  # Just dies
+        rng.value = 1.0
+        manager.seed_survival_threshold = 0.9
+        self.assertFalse(manager._check_seed_survival())  # Just dies
 
     def test_seed_survival_transition(self):
         """Test state transitions based on seed survival."""
         # Test survival case
-        with patch('random.random', return_value=0.5):
-            self.manager.seed_survival_threshold = 0.7  # Will survive
-            self.assertEqual(self.manager.state, PlantState.SEED)
-            self.manager.update(self.manager.SEED_DURATION + 0.1)  # Trigger check
-            self.assertEqual(self.manager.state, PlantState.GROWING)
-            self.assertEqual(self.manager.time_in_state, 0.0)
+        self.rng.value = 0.5
+        self.manager.seed_survival_threshold = 0.7  # Will survive
+        self.assertEqual(self.manager.state, PlantState.SEED)
+        self.manager.update(self.past_seed_duration)  # Trigger check
+        self.assertEqual(self.manager.state, PlantState.GROWING)
+        self.assertEqual(self.manager.time_in_state, 0.0)
 
         # Test death case
-        manager2 = PlantStateManager()  # Fresh instance for death test
-        with patch('random.random', return_value=0.9):
-            manager2.seed_survival_threshold = 0.7  # Will die
-            self.assertEqual(manager2.state, PlantState.SEED)
-            manager2.update(manager2.SEED_DURATION + 0.1)  # Trigger check
-            self.assertEqual(manager2.state, PlantState.DYING)
-            self.assertEqual(manager2.time_in_state, 0.0)
+        self.manager.reset()  # Fresh seed for death test
+        self.rng.value = 0.9
+        self.manager.seed_survival_threshold = 0.7  # Will die
+        self.assertEqual(self.manager.state, PlantState.SEED)
+        self.manager.update(self.past_seed_duration)  # Trigger check
+        self.assertEqual(self.manager.state, PlantState.DYING)
+        self.assertEqual(self.manager.time_in_state, 0.0)
 
     def test_seed_death_progression(self):
         """Test that a dying seed progresses through states correctly."""
-        with patch('random.random', return_value=0.9):  # Will die
-            self.manager.seed_survival_threshold = 0.7
-            
-            # Progress to dying state
-            self.manager.update(self.manager.SEED_DURATION + 0.1)
-            self.assertEqual(self.manager.state, PlantState.DYING)
-            self.assertEqual(self.manager.health, 1.0)  # Starts with full health
-            
-            # Half-way through dying
-            self.manager.update(self.manager.DYING_DURATION / 2)
-            self.assertEqual(self.manager.state, PlantState.DYING)
-            self.assertAlmostEqual(self.manager.health, 0.5, places=2)
-            
-            # Complete death
-            self.manager.update(self.manager.DYING_DURATION / 2)
-            self.assertEqual(self.manager.state, PlantState.DEAD)
-            self.assertEqual(self.manager.health, 0.0)
-
-    def test_seed_survival_threshold_validation(self):
-        """Test that seed survival threshold validates input correctly."""
-        # Test valid values
-        valid_values = [0.0, 0.5, 1.0]
-        for value in valid_values:
-            self.manager.seed_survival_threshold = value
-            self.assertEqual(self.manager.seed_survival_threshold, value)
+        self.rng.value = 0.9  # Will die
+        self.manager.seed_survival_threshold = 0.7
+
+        # Progress to dying state
+        self.manager.update(self.past_seed_duration)
+        self.assertEqual(self.manager.state, PlantState.DYING)
+        self.assertEqual(self.manager.health, 1.0)  # Starts with full health
+
+        # Half-way through dying
+        self.manager.update(self.manager.DYING_DURATION / 2)
+        self.assertEqual(self.manager.state, PlantState.DYING)
+        self.assertClose(self.manager.health, 0.5)
 
-        # Test invalid values
+        # Complete death
+        self.manager.update(self.manager.DYING_DURATION / 2)
+        self.assertEqual(self.manager.state, PlantState.DEAD)
+        self.assertEqual(self.manager.health, 0.0)
+
+    def test_probability_setter_validation(self):
+        """Test that the survival threshold and flowering probability validate input."""
+        valid_values = [0.0, 0.5, 1.0]
         invalid_values = [-0.1, 1.1, -1, 2]
-        for value in invalid_values:
-            with self.assertRaises(ValueError):
-                self.manager.seed_survival_threshold = value
+
+        for attr in ('seed_survival_threshold', 'flowering_probability'):
+            for value in valid_values:
+                with self.subTest(attr=attr, value=value):
+                    setattr(self.manager, attr, value)
+                    self.assertEqual(getattr(self.manager, attr), value)
+
+            for value in invalid_values:
+                with self.subTest(attr=attr, value=value), self.assertRaises(ValueError):
+                    setattr(self.manager, attr, value)
 
     def test_seed_survival_threshold_persistence(self):
         """Test that seed survival threshold persists through state changes."""
@@ -100,60 +173,53 @@ class TestPlantStateManager(unittest.TestCase):
         new_threshold = 0.8
         self.manager.seed_survival_threshold = new_threshold
         
-        # Progress through states
-        self.manager.update(self.manager.SEED_DURATION + 0.1)  # To GROWING
-        self.assertEqual(self.manager.seed_survival_threshold, new_threshold)
-        
-        self.manager.update(self.manager.GROWTH_THRESHOLD)  # To MATURE
-        self.assertEqual(self.manager.seed_survival_threshold, new_threshold)
-        
-        self.manager.update(self.manager.MATURE_MAX_TIME + 0.1)  # To DYING
-        self.assertEqual(self.manager.seed_survival_threshold, new_threshold)
-        
-        self.manager.update(self.manager.DYING_DURATION)  # To DEAD
+        # Progress through every state; update advances at most one state per call
+        for dt in (self.past_seed_duration, self.manager.GROWTH_THRESHOLD,
+                   self.past_mature_max_time, self.manager.DYING_DURATION):
+            self.manager.update(dt)
+        self.assertEqual(self.manager.state, PlantState.DEAD)
         self.assertEqual(self.manager.seed_survival_threshold, new_threshold)
 
     def test_seed_to_growing_transition(self):
         """Test transition from seed to growing state after SEED_DURATION."""
-        with patch('random.random', return_value=0.5):  # Will survive with default threshold of 0.7
-            self.assertEqual(self.manager.state, PlantState.SEED)
-            # Update with less than SEED_DURATION
-            self.manager.update(0.1)
-            self.assertEqual(self.manager.state, PlantState.SEED)
-            # Update past SEED_DURATION
-            self.manager.update(self.manager.SEED_DURATION)
-            self.assertEqual(self.manager.state, PlantState.GROWING)
-            self.assertEqual(self.manager.time_in_state, 0.0)
+        self.rng.value = 0.5  # Will survive with default threshold of 0.7
+        self.assertEqual(self.manager.state, PlantState.SEED)
+        # Update with less than SEED_DURATION
+        self.manager.update(0.1)
+        self.assertEqual(self.manager.state, PlantState.SEED)
+        # Update past SEED_DURATION
+        self.manager.update(self.manager.SEED_DURATION)
+        self.assertEqual(self.manager.state, PlantState.GROWING)
+        self.assertEqual(self.manager.time_in_state, 0.0)
 
     def test_growth_progression(self):
         """Test that growth progresses correctly over time."""
-        with patch('random.random', return_value=0.5):  # Will survive with default threshold
-            # Get to growing state
-            self.manager.update(self.manager.SEED_DURATION + 0.1)
-            self.assertEqual(self.manager.state, PlantState.GROWING)
+        # Start from a freshly grown seed
+        self.manager = self._from_snapshot(self.growing_snapshot)
+        self.assertEqual(self.manager.state, PlantState.GROWING)
 
-            # Partial growth
-            self.manager.update(self.manager.GROWTH_THRESHOLD / 2)
-            self.assertEqual(self.manager.state, PlantState.GROWING)
-            self.assertAlmostEqual(self.manager.growth, 0.5, places=2)
+        # Partial growth
+        self.manager.update(self.manager.GROWTH_THRESHOLD / 2)
+        self.assertEqual(self.manager.state, PlantState.GROWING)
+        self.assertClose(self.manager.growth, 0.5)
 
-            # Complete growth
-            self.manager.update(self.manager.GROWTH_THRESHOLD / 2)
-            self.assertEqual(self.manager.state, PlantState.MATURE)
-            self.assertEqual(self.manager.growth, 1.0)
+        # Complete growth
+        self.manager.update(self.manager.GROWTH_THRESHOLD / 2)
+        self.assertEqual(self.manager.state, PlantState.MATURE)
+        self.assertEqual(self.manager.growth, 1.0)
 
     def test_mature_to_dying_transition(self):
         """Test transition from mature to dying state."""
         # Start in mature state
-        with patch('random.random', return_value=0.9):  # Won't flower
-            self.manager.state = PlantState.MATURE
-            self.manager.time_in_state = self.manager.MATURE_MAX_TIME * 0.8  # Past flowering check
-            self.manager.flowering_probability = 0.3
+        self.rng.value = 0.9  # Won't flower
+        self.manager.state = PlantState.MATURE
+        self.manager.time_in_state = self.manager.MATURE_MAX_TIME * 0.8  # Past flowering check
+        self.manager.flowering_probability = 0.3
 
-            # Update past max time
-            self.manager.update(self.manager.MATURE_MAX_TIME * 0.5)  # Push well past max time
-            self.assertEqual(self.manager.state, PlantState.DYING)
-            self.assertEqual(self.manager.time_in_state, 0.0)
+        # Update past max time
+        self.manager.update(self.manager.MATURE_MAX_TIME * 0.5)  # Push well past max time
+        self.assertEqual(self.manager.state, PlantState.DYING)
+        self.assertEqual(self.manager.time_in_state, 0.0)
 
     def test_dying_progression(self):
         """Test that dying state progresses correctly."""
@@ -165,13 +231,39 @@ class TestPlantStateManager(unittest.TestCase):
         # Update halfway through dying duration
         self.manager.update(self.manager.DYING_DURATION / 2)
         self.assertEqual(self.manager.state, PlantState.DYING)
-        self.assertAlmostEqual(self.manager.health, 0.5, places=2)
+        self.assertClose(self.manager.health, 0.5)
 
         # Complete death
         self.manager.update(self.manager.DYING_DURATION / 2)
         self.assertEqual(self.manager.state, PlantState.DEAD)
         self.assertEqual(self.manager.health, 0.0)
 
+    def test_reset(self):
+        """Test that reset returns a used manager to a fresh seed."""
+        rng = _FixedRandom(0.5)
+        manager = PlantStateManager(rng=rng)
+        manager.seed_survival_threshold = 0.9
+        manager.update(self.past_seed_duration)
+        manager.update(self.manager.GROWTH_THRESHOLD / 2)
+
+        manager.reset()
+        self.assertEqual(manager.state, PlantState.SEED)
+        self.assertEqual(manager.time_in_state, 0.0)
+        self.assertEqual(manager.health, 1.0)
+        self.assertEqual(manager.growth, 0.0)
+        self.assertFalse(manager.has_checked_flowering)
+        self.assertEqual(manager.seed_survival_threshold, SEED_SURVIVAL_THRESHOLD)
+        self.assertIs(manager._rng, rng)
+
+    def test_dead_state_is_final(self):
+        """Test that updates leave a dead plant untouched."""
+        self.manager.state = PlantState.DEAD
+        self.manager.health = 0.0
+        self.manager.update(self.manager.DYING_DURATION)
+        self.assertEqual(self.manager.state, PlantState.DEAD)
+        self.assertEqual(self.manager.time_in_state, 0.0)
+        self.assertEqual(self.manager.health, 0.0)
+
     def test_color_factor(self):
         """Test that color factor returns correct values for each state."""
         # Test SEED state
@@ -217,141 +309,135 @@ class TestPlantStateManager(unittest.TestCase):
 
     def test_state_sequence(self):
         """Test that states always follow the correct sequence."""
-        with patch('random.random', return_value=0.5):  # Will survive with default threshold
-            states_seen = []
-            last_state = None
-
-            # Run through entire lifecycle with smaller time steps
-            while self.manager.state != PlantState.DEAD:
-                current_state = self.manager.state
-                # Only record state when it changes
-                if current_state != last_state:
-                    states_seen.append(current_state)
-                    last_state = current_state
-                self.manager.update(0.5)  # Larger time step for quicker transitions
-
-            # Add final state
-            if self.manager.state not in states_seen:
-                states_seen.append(PlantState.DEAD)
-
-            # Verify sequence
-            expected_sequence = [
-                PlantState.SEED,
-                PlantState.GROWING,
-                PlantState.MATURE,
-                PlantState.DYING,
-                PlantState.DEAD
-            ]
-
-            self.assertEqual(states_seen, expected_sequence)
-
-    def test_flowering_probability_validation(self):
-        """Test that flowering probability validates input correctly."""
-        # Test valid values
-        valid_values = [0.0, 0.5, 1.0]
-        for value in valid_values:
-            self.manager.flowering_probability = value
-            self.assertEqual(self.manager.flowering_probability, value)
-
-        # Test invalid values
-        invalid_values = [-0.1, 1.1, -1, 2]
-        for value in invalid_values:
-            with self.assertRaises(ValueError):
-                self.manager.flowering_probability = value
+        manager = self.manager
+        # Each step is exactly long enough to reach the next state
+        steps = [
+            self.past_seed_duration,
+            manager.GROWTH_THRESHOLD,
+            self.past_mature_max_time,
+            manager.DYING_DURATION
+        ]
+        self.rng.value = 0.5  # Will survive with default threshold
+        states_seen = [manager.state]
+        for dt in steps:
+            manager.update(dt)
+            states_seen.append(manager.state)
+
+        # Verify sequence
+        expected_sequence = [
+            PlantState.SEED,
+            PlantState.GROWING,
+            PlantState.MATURE,
+            PlantState.DYING,
+            PlantState.DEAD
+        ]
+
+        self.assertEqual(states_seen, expected_sequence)
+
+    def test_flowering_check_time(self):
+        """Test that flowering is checked in the last quarter of maturity."""
+        self.assertAlmostEqual(self.manager.FLOWERING_CHECK_TIME, self.manager.MATURE_MAX_TIME * 0.75)
 
     def test_flowering_check(self):
         """Test that flowering check works correctly."""
+        rng = _FixedRandom(0.2)
+        manager = PlantStateManager(rng=rng)
+        manager.flowering_probability = 0.3
+
         # Test with random value below threshold (will flower)
-        with patch('random.random', return_value=0.2):
-            self.manager.flowering_probability = 0.3
-            self.assertTrue(self.manager._check_flowering())
+        self.assertTrue(manager._check_flowering())
 
         # Test with random value above threshold (won't flower)
-        with patch('random.random', return_value=0.4):
-            self.manager.flowering_probability = 0.3
-            self.assertFalse(self.manager._check_flowering())
+        rng.value = 0.4
+        self.assertFalse(manager._check_flowering())
+
+    def test_global_random_source(self):
+        """Test that managers without an injected source use the random module."""
+        manager = PlantStateManager()
+        with fixed_random(0.2):
+            manager.flowering_probability = 0.3
+            self.assertTrue(manager._check_flowering())
+
+        manager = PlantStateManager(rng=_FixedRandom(0.9))
+        with fixed_random(0.2):
+            self.assertFalse(manager._check_seed_survival())
 
     def test_mature_to_flowering_transition(self):
         """Test transition from mature to flowering state."""
-        # Get to mature state
-        with patch('random.random', return_value=0.5):  # Will survive seed phase
-            self.manager.update(self.manager.SEED_DURATION + 0.1)  # Seed -> Growing
-            self.manager.update(self.manager.GROWTH_THRESHOLD)  # Complete growth
-            self.assertEqual(self.manager.state, PlantState.MATURE)
-
-            # Update to just before flowering check point (75% of mature time)
-            self.manager.update(self.manager.MATURE_MAX_TIME * 0.74)
-            self.assertEqual(self.manager.state, PlantState.MATURE)
-
-            # Update past flowering check point with high probability
-            with patch('random.random', return_value=0.2):  # Will flower
-                self.manager.flowering_probability = 0.3
-                self.manager.update(self.manager.MATURE_MAX_TIME * 0.02)  # Just past check point
-                self.assertEqual(self.manager.state, PlantState.FLOWERING)
-                self.assertEqual(self.manager.time_in_state, 0.0)
+        # Start from a freshly matured plant
+        self.manager = self._from_snapshot(self.mature_snapshot)
+        self.assertEqual(self.manager.state, PlantState.MATURE)
+
+        # Update to just before flowering check point (75% of mature time)
+        self.manager.update(self.manager.MATURE_MAX_TIME * 0.74)
+        self.assertEqual(self.manager.state, PlantState.MATURE)
+
+        # Update past flowering check point with high probability
+        self.rng.value = 0.2  # Will flower
+        self.manager.flowering_probability = 0.3
+        self.manager.update(self.manager.MATURE_MAX_TIME * 0.02)  # Just past check point
+        self.assertEqual(self.manager.state, PlantState.FLOWERING)
+        self.assertEqual(self.manager.time_in_state, 0.0)
 
     def test_no_flowering_transition(self):
         """Test that plant can go directly to dying if not flowering."""
         # Start in mature state
-        with patch('random.random', return_value=0.9):  # Won't flower
-            self.manager.state = PlantState.MATURE
-            self.manager.time_in_state = self.manager.MATURE_MAX_TIME * 0.8  # Past flowering check
-            self.manager.flowering_probability = 0.3
+        self.rng.value = 0.9  # Won't flower
+        self.manager.state = PlantState.MATURE
+        self.manager.time_in_state = self.manager.MATURE_MAX_TIME * 0.8  # Past flowering check
+        self.manager.flowering_probability = 0.3
 
-            # Update past max time
-            self.manager.update(self.manager.MATURE_MAX_TIME * 0.5)  # Push well past max time
-            self.assertEqual(self.manager.state, PlantState.DYING)
-            self.assertEqual(self.manager.time_in_state, 0.0)
+        # Update past max time
+        self.manager.update(self.manager.MATURE_MAX_TIME * 0.5)  # Push well past max time
+        self.assertEqual(self.manager.state, PlantState.DYING)
+        self.assertEqual(self.manager.time_in_state, 0.0)
 
     def test_flowering_duration(self):
         """Test that flowering state lasts for the correct duration."""
-        # Get to flowering state
-        with patch('random.random', return_value=0.2):  # Will survive and flower
-            self.manager.flowering_probability = 0.3
-            self.manager.update(self.manager.SEED_DURATION + 0.1)  # Seed -> Growing
-            self.manager.update(self.manager.GROWTH_THRESHOLD)  # Complete growth
-            self.manager.update(self.manager.MATURE_MAX_TIME * 0.76)  # Trigger flowering check
-            self.assertEqual(self.manager.state, PlantState.FLOWERING)
-
-            # Update with less than flowering duration
-            self.manager.update(self.manager.FLOWERING_DURATION * 0.9)
-            self.assertEqual(self.manager.state, PlantState.FLOWERING)
-
-            # Update past flowering duration
-            self.manager.update(self.manager.FLOWERING_DURATION * 0.2)
-            self.assertEqual(self.manager.state, PlantState.DYING)
+        # Get to flowering state from a freshly matured plant
+        self.manager = self._from_snapshot(self.mature_snapshot)
+        self.rng.value = 0.2  # Will flower
+        self.manager.flowering_probability = 0.3
+        self.manager.update(self.past_flowering_check)  # Trigger flowering check
+        self.assertEqual(self.manager.state, PlantState.FLOWERING)
+
+        # Update with less than flowering duration
+        self.manager.update(self.manager.FLOWERING_DURATION * 0.9)
+        self.assertEqual(self.manager.state, PlantState.FLOWERING)
+
+        # Update past flowering duration
+        self.manager.update(self.manager.FLOWERING_DURATION * 0.2)
+        self.assertEqual(self.manager.state, PlantState.DYING)
 
     def test_flowering_state_sequence(self):
         """Test that flowering follows the correct state sequence."""
-        with patch('random.random', return_value=0.2):  # Will survive and flower
-            self.manager.flowering_probability = 0.3
-            states_seen = []
-            last_state = None
-
-            # Run through entire lifecycle with smaller time steps
-            while self.manager.state != PlantState.DEAD:
-                current_state = self.manager.state
-                # Only record state when it changes
-                if current_state != last_state:
-                    states_seen.append(current_state)
-                    last_state = current_state
-                self.manager.update(0.5)
-
-            # Add final state if not already recorded
-            if self.manager.state not in states_seen:
-                states_seen.append(PlantState.DEAD)
-
-            # Verify sequence includes flowering
-            expected_sequence = [
-                PlantState.SEED,
-                PlantState.GROWING,
-                PlantState.MATURE,
-                PlantState.FLOWERING,
-                PlantState.DYING,
-                PlantState.DEAD
-            ]
-
-            self.assertEqual(states_seen, expected_sequence)
+        manager = self.manager
+        # Each step is exactly long enough to reach the next state
+        steps = [
+            self.past_seed_duration,
+            manager.GROWTH_THRESHOLD,
+            self.past_flowering_check,
+            manager.FLOWERING_DURATION,
+            manager.DYING_DURATION
+        ]
+        self.rng.value = 0.2  # Will survive and flower
+        manager.flowering_probability = 0.3
+        states_seen = [manager.state]
+        for dt in steps:
+            manager.update(dt)
+            states_seen.append(manager.state)
+
+        # Verify sequence includes flowering
+        expected_sequence = [
+            PlantState.SEED,
+            PlantState.GROWING,
+            PlantState.MATURE,
+            PlantState.FLOWERING,
+            PlantState.DYING,
+            PlantState.DEAD
+        ]
+
+        self.assertEqual(states_seen, expected_sequence)
 
 
 if __name__ == '__main__':
@@ -18,9 +18,12 @@ class TestWaterHexagon(unittest.TestCase):
 
     def test_update_no_change(self):
         """Test that update method doesn't change the state."""
-        initial_points = self.water.points.copy()
+        points = self.water.points
+        initial_points = tuple(points)
         self.water.update(1.5)
-        self.assertEqual(self.water.points, initial_points)
+        # Update must neither replace nor modify the vertex list
+        self.assertIs(self.water.points, points)
+        self.assertEqual(tuple(points), initial_points)
 
     def test_color(self):
         """Test that the water hexagon returns the correct color."""
@@ -34,7 +34,9 @@ class MockRenderer(BaseRenderer):
         self.begin_frame_called = False
         self.end_frame_called = False
         self.cleanup_called = False
+        # Drawn hexagons and their show_grid flags are kept in parallel lists
         self.drawn_hexagons = []
+        self.drawn_show_grid = []
         self.drawn_texts = []
         self.drawn_overlays = []
     
@@ -50,7 +52,8 @@ class MockRenderer(BaseRenderer):
         self.end_frame_called = True
     
     def draw_hexagon(self, hexagon: Renderable, show_grid: bool = True) -> None:
-        self.drawn_hexagons.append((hexagon, show_grid))
+        self.drawn_hexagons.append(hexagon)
+        self.drawn_show_grid.append(show_grid)
     
     def draw_text(self, text: str, position: Tuple[int, int], color: Tuple[int, int, int],
                  centered: bool = False, font_size: int = 36) -> None:
@@ -105,10 +108,8 @@ class TestBaseRenderer(unittest.TestCase):
     def test_draw_hexagon(self):
         """Test that draw_hexagon method records correct parameters."""
         self.renderer.draw_hexagon(self.renderable, show_grid=True)
-        self.assertEqual(len(self.renderer.drawn_hexagons), 1)
-        hexagon, show_grid = self.renderer.drawn_hexagons[0]
-        self.assertEqual(hexagon, self.renderable)
-        self.assertTrue(show_grid)
+        self.assertEqual(self.renderer.drawn_hexagons, [self.renderable])
+        self.assertEqual(self.renderer.drawn_show_grid, [True])
     
     def test_draw_text(self):
         """Test that draw_text method records correct parameters."""
@@ -5,6 +5,7 @@ import pygame
 import math
 from unittest.mock import Mock, patch
 from src.renderers.pygame_renderer import PygameRenderer
+from src.hexagons.plant import PlantHexagon
 from src.hexagons.plant_states import PlantState
 from tests.renderers.test_base import MockRenderable
 from tests.test_config import (
@@ -13,6 +14,9 @@ from tests.test_config import (
     MOCK_COLORS
 )
 
+# Colors used by the renderer fixtures, looked up once at import
+_GREEN, _MATURE, _FLOWER = (MOCK_COLORS[k] for k in ('GREEN', 'MATURE', 'FLOWER'))
+
 
 class MockFloweringPlant(MockRenderable):
     """Mock implementation of a flowering plant for testing."""
@@ -20,15 +24,15 @@ class MockFloweringPlant(MockRenderable):
     def __init__(self, cx, cy, a, flower_angle=0.0):
         super().__init__(
             points=[(0, 0), (10, 0), (10, 10), (0, 10)],
-            color=MOCK_COLORS['FLOWER'],
-            base_color=MOCK_COLORS['MATURE']
+            color=_FLOWER,
+            base_color=_MATURE
         )
         self.cx = cx
         self.cy = cy
         self.a = a
         self.flower_angle = flower_angle
         self.FLOWER_ORBIT_RADIUS = 0.4
-        self.detail_color = MOCK_COLORS['FLOWER']
+        self.detail_color = _FLOWER
         self.detail_radius = 0.12
         self.state_manager = Mock()
         self.state_manager.state = PlantState.FLOWERING
@@ -44,8 +48,8 @@ class TestPygameRenderer(unittest.TestCase):
         # Create a mock renderable with both color and base_color
         self.renderable = MockRenderable(
             points=[(0, 0), (10, 0), (10, 10), (0, 10)],
-            color=MOCK_COLORS['GREEN'],
-            base_color=MOCK_COLORS['GREEN']  # Add base_color
+            color=_GREEN,
+            base_color=_GREEN  # Add base_color
         )
 
     def test_initialization(self):
@@ -82,18 +86,48 @@ class TestPygameRenderer(unittest.TestCase):
         self.renderer.begin_frame()
         self.renderer.draw_text(text, position, color)
         
-        # Get the color of a few pixels around the text position
-        colors = [
-            self.renderer.screen.get_at((x, y))[:3]
-            for x in range(position[0]-5, position[0]+5)
-            for y in range(position[1]-5, position[1]+5)
-        ]
-        
+        # Read the pixels around the text position in one buffered copy
+        pixels = pygame.surfarray.array3d(self.renderer.screen)
+        region = pixels[position[0]-5:position[0]+5, position[1]-5:position[1]+5]
+
         # At least one pixel should be different from background
         background_color = (30, 30, 30)
-        self.assertTrue(any(c != background_color for c in colors),
+        self.assertTrue((region != background_color).any(axis=-1).any(),
                        "No text pixels found different from background")
 
+    def test_draw_text_cache(self):
+        """Test that repeated text is rendered once and reused."""
+        color = (255, 255, 255)
+        first = self.renderer._render_text("Test", color, 36)
+        second = self.renderer._render_text("Test", color, 36)
+        self.assertIs(first, second)
+
+        # Different size or color should produce a new surface
+        self.assertIsNot(first, self.renderer._render_text("Test", color, 24))
+        self.assertIsNot(first, self.renderer._render_text("Test", (255, 0, 0), 36))
+
+    def test_text_cache_size_limit(self):
+        """Test that the least recently used surface is dropped when the cache is full."""
+        color = (255, 255, 255)
+        first = self.renderer._render_text("0", color, 36)
+        for i in range(1, PygameRenderer.TEXT_CACHE_SIZE):
+            self.renderer._render_text(str(i), color, 36)
+        # Using the first entry again keeps it over the next oldest one
+        self.assertIs(self.renderer._render_text("0", color, 36), first)
+
+        self.renderer._render_text("new", color, 36)
+        self.assertEqual(len(self.renderer._text_cache), PygameRenderer.TEXT_CACHE_SIZE)
+        self.assertIn(("0", color, 36), self.renderer._text_cache)
+        self.assertNotIn(("1", color, 36), self.renderer._text_cache)
+
+    def test_text_cache_cleared_on_setup(self):
+        """Test that setup discards surfaces rendered with old fonts."""
+        self.renderer.draw_text("Test", (10, 10), (255, 255, 255))
+        self.assertEqual(len(self.renderer._text_cache), 1)
+
+        self.renderer.setup(MOCK_SCREEN_WIDTH, MOCK_SCREEN_HEIGHT)
+        self.assertEqual(len(self.renderer._text_cache), 0)
+
     def test_draw_overlay(self):
         """Test that overlay is drawn correctly."""
         overlay_color = (0, 0, 0, 128)
@@ -105,14 +139,20 @@ class TestPygameRenderer(unittest.TestCase):
         color = self.renderer.screen.get_at((0, 0))
         self.assertNotEqual(color[:3], (30, 30, 30))  # Should not be background color
 
+    def test_overlay_surface_reused(self):
+        """Test that the overlay surface is allocated once at the screen size."""
+        overlay = self.renderer._overlay
+        self.assertEqual(overlay.get_size(), (MOCK_SCREEN_WIDTH, MOCK_SCREEN_HEIGHT))
+
+        self.renderer.begin_frame()
+        self.renderer.draw_overlay((0, 0, 0, 128))
+        self.renderer.draw_overlay((255, 0, 0, 64))
+        self.assertIs(self.renderer._overlay, overlay)
+
     def test_cleanup(self):
         """Test that cleanup works without errors."""
-        try:
-            self.renderer.cleanup()
-            success = True
-        except Exception:
-            success = False
-        self.assertTrue(success)
+        # Any exception errors the test with its full traceback
+        self.renderer.cleanup()
 
     def test_flower_dot_positions(self):
         """Test that flower dots are positioned correctly."""
@@ -135,7 +175,7 @@ class TestPygameRenderer(unittest.TestCase):
         distance = plant.a * plant.FLOWER_ORBIT_RADIUS
         expected_positions = []
         for i in range(3):
-            theta = plant.flower_angle + (i * 2 * math.pi / 3)
+            theta = plant.flower_angle + (i * math.tau / 3)
             x = int(plant.cx + distance * math.cos(theta))
             y = int(plant.cy + distance * math.sin(theta))
             expected_positions.append((x, y))
@@ -170,12 +210,12 @@ class TestPygameRenderer(unittest.TestCase):
             angle2 = math.atan2(pos2[1] - center[1], pos2[0] - center[0])
             
             # Calculate angle difference and normalize to [0, 2π]
-            diff = (angle2 - angle1) % (2 * math.pi)
+            diff = (angle2 - angle1) % math.tau
             angles.append(diff)
         
         # All angles should be approximately 120 degrees (2π/3 radians)
         # Use places=1 to account for integer rounding effects
-        expected_angle = 2 * math.pi / 3
+        expected_angle = math.tau / 3
         for angle in angles:
             self.assertAlmostEqual(angle, expected_angle, places=1)
 
@@ -204,6 +244,29 @@ class TestPygameRenderer(unittest.TestCase):
             self.assertLess(abs(distance - expected_distance), 0.5,
                           f"Distance {distance} differs from expected {expected_distance} by more than 0.5 units")
 
+    def test_flowering_plant_before_first_update(self):
+        """Test that a plant set to flowering is drawn before its first update."""
+        plant = PlantHexagon(50, 50, 10)
+        plant.state_manager.state = PlantState.FLOWERING
+        self.assertTrue(math.isnan(plant.flower_angle))
+
+        drawn_positions = []
+        def mock_draw_circle(screen, color, pos, radius):
+            drawn_positions.append(pos)
+
+        with patch('pygame.draw.circle', side_effect=mock_draw_circle):
+            self.renderer.begin_frame()
+            self.renderer.draw_hexagon(plant)
+
+        # Without an angle the dots are drawn at angle 0
+        distance = plant.a * plant.FLOWER_ORBIT_RADIUS
+        expected_positions = [
+            (int(plant.cx + distance * math.cos(i * math.tau / 3)),
+             int(plant.cy + distance * math.sin(i * math.tau / 3)))
+            for i in range(3)
+        ]
+        self.assertEqual(drawn_positions, expected_positions)
+
     def tearDown(self):
         """Clean up after each test method."""
         pygame.quit()
@@ -9,6 +9,10 @@ MOCK_CELL_SIZE = 10
 MOCK_COLUMNS = 8
 MOCK_ROWS = 8
 
+# Smaller grid for tests that only check per-cell behaviour
+MOCK_SMALL_COLUMNS = 4
+MOCK_SMALL_ROWS = 4
+
 # Mock colors for testing (matching the actual colors from src/config.py)
 MOCK_COLORS = {
     'GREEN': (34, 139, 34),      # Forest green for mature plants
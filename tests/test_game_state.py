@@ -9,7 +9,6 @@ from src import i18n
 class TestGameStateManager(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures before each test method."""
-        pygame.init()
         self.manager = GameStateManager()
         # Store initial language
         self.initial_language = i18n.get_current_language()
@@ -213,7 +212,6 @@ class TestGameStateManager(unittest.TestCase):
         """Clean up after each test method."""
         # Restore initial language
         i18n.switch_language(self.initial_language)
-        pygame.quit()
 
 
 if __name__ == '__main__':
@@ -1,7 +1,6 @@
 """Integration tests for i18n with game state management."""
 
 import unittest
-import pygame
 from src.game_state import GameStateManager, GameState
 from src.i18n.string_provider import StringProvider
 from src.i18n.language_manager import Language
@@ -37,7 +36,6 @@ class TestI18NGameStateIntegration(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        pygame.init()
         # Store the initial language
         self.initial_language = i18n.get_current_language()
         # Set up our mock provider
@@ -136,7 +134,6 @@ class TestI18NGameStateIntegration(unittest.TestCase):
         """Clean up after each test method."""
         # Restore initial language
         i18n.switch_language(self.initial_language)
-        pygame.quit()
 
 
 if __name__ == '__main__':
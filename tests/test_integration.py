@@ -1,5 +1,6 @@
 """Integration tests for the Life Simulation game loop."""
 
+import os
 import unittest
 import pygame
 import time
@@ -18,14 +19,28 @@ from tests.test_config import (
 
 
 class TestGameIntegration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Initialize Pygame and the renderer once for all tests."""
+        # Skip probing for a real display backend unless one was chosen. The
+        # environment is restored once this class's tests have run.
+        cls.environ_patch = patch.dict(
+            os.environ, {'SDL_VIDEODRIVER': os.environ.get('SDL_VIDEODRIVER', 'dummy')})
+        cls.environ_patch.start()
+        cls.renderer = PygameRenderer()
+        cls.renderer.setup(MOCK_SCREEN_WIDTH, MOCK_SCREEN_HEIGHT)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Shut down Pygame after all tests have run."""
+        cls.renderer.cleanup()
+        cls.environ_patch.stop()
+
     def setUp(self):
         """Set up test fixtures before each test method."""
-        # Set fixed seed for consistent plant generation
-        random.seed(12345)
-        pygame.init()
-        self.renderer = PygameRenderer()
-        self.renderer.setup(MOCK_SCREEN_WIDTH, MOCK_SCREEN_HEIGHT)
-        self.mesh = HexMesh(MOCK_COLUMNS, MOCK_ROWS, MOCK_SCREEN_WIDTH, MOCK_SCREEN_HEIGHT)
+        # Seeded random source for consistent plant generation
+        self.mesh = HexMesh(MOCK_COLUMNS, MOCK_ROWS, MOCK_SCREEN_WIDTH, MOCK_SCREEN_HEIGHT,
+                            rng=random.Random(12345))
         self.state_manager = GameStateManager()
         self.background_color = (30, 30, 30)
 
@@ -203,12 +218,6 @@ class TestGameIntegration(unittest.TestCase):
             self.simulate_game_loop(1)  # Run one frame to ensure stability
             self.assertEqual(self.state_manager.current_state, expected_state)
 
-    def tearDown(self):
-        """Clean up after each test method."""
-        self.renderer.cleanup()
-        # Reset random seed
-        random.seed()
-
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file